@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
 import errors
 import fields
+import memory
 import models
+import scheduler
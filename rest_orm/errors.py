@@ -5,3 +5,29 @@ class AdapterError(Exception):
     """Unreachable endpoint error."""
 
     pass
+
+
+class ThrottledError(AdapterError):
+    """Remote endpoint rejected the request due to rate limiting."""
+
+    pass
+
+
+class LoadError(AdapterError):
+    """One or more fields failed to load.
+
+    `errors` maps each failing field's name, or list index for lists of
+    nested models, to the exception it raised.  Nested models report their
+    own `LoadError`.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super(LoadError, self).__init__('Failed to load {}.'.format(
+            ', '.join(str(key) for key in sorted(errors))))
+
+
+class MemoryBudgetExceeded(AdapterError):
+    """Loading a response would exceed the configured memory budget."""
+
+    pass
@@ -2,9 +2,14 @@
 from datetime import datetime
 from decimal import Decimal
 
+from rest_orm.errors import LoadError
 from rest_orm.utils import get_class
 
 
+#: Sentinel returned by path lookups which could not be resolved.
+MISSING = object()
+
+
 class AdaptedField(object):
     """Flat representaion of remote endpoint's field.
 
@@ -24,58 +29,155 @@ class AdaptedField(object):
         :param validate: A callable object.
         """
         self.path = path
+        self.keys = self.parse_path(path)
         self.missing = missing
         self.nullable = nullable
         self.required = required
         self.validate = validate
 
-    def deserialize(self, data):
+    def deserialize(self, data, collect_errors=False):
         """Extract a value from the provided data object.
 
         :param data: A dictionary object.
+        :param collect_errors: If `True`, nested models collect every field
+            error into a single `LoadError`.
         """
         if self.path is None:
-            return self._deserialize(data)
+            return self._deserialize_value(data, collect_errors)
 
-        try:
-            raw_value = self.map_from_string(self.path, data)
-        except (KeyError, IndexError):
+        raw_value = self.lookup(self.keys, data)
+        if raw_value is MISSING:
             if self.required:
                 raise KeyError('{} not found.'.format(self.path))
             value = self.missing
+        elif raw_value is None and self.nullable:
+            value = None
         else:
-            if raw_value is None and self.nullable:
-                value = None
-            else:
-                value = self._deserialize(raw_value)
+            value = self._deserialize_value(raw_value, collect_errors)
 
         self._validate(value)
         return value
 
+    def serialize(self, value):
+        """Return a JSON compatible representation of the provided value.
+
+        :param value: A deserialized value.
+        """
+        if value is None:
+            return None
+        return self._serialize(value)
+
     def _deserialize(self, value):
         return value
 
+    def _deserialize_value(self, value, collect_errors):
+        return self._deserialize(value)
+
+    def _serialize(self, value):
+        return value
+
     def _validate(self, value):
         if self.validate is not None:
             self.validate(value)
         return None
 
+    def parse_path(self, path):
+        """Return the list of keys and indexes referenced by a string path.
+
+        Segments which can be cast to integers are treated as indexes.
+
+        :param path: A string path to the value.  E.g. [name][first][0].
+        """
+        if path is None:
+            return None
+
+        keys = []
+        for key in path[1:-1].split(']['):
+            try:
+                keys.append(int(key))
+            except ValueError:
+                keys.append(key)
+        return keys
+
     def map_from_string(self, path, data):
         """Return nested value from the string path taken.
 
         :param path: A string path to the value.  E.g. [name][first][0].
         :param data: A dictionary object.
         """
-        def extract_by_type(path):
-            try:
-                return data[int(path)]
-            except ValueError:
-                return data[path]
+        return self.map_from_keys(self.parse_path(path), data)
 
-        for path in path[1:-1].split(']['):
-            data = extract_by_type(path)
+    def map_from_keys(self, keys, data):
+        """Return nested value from the parsed path taken.
+
+        :param keys: A list of keys and indexes.  E.g. ['name', 'first', 0].
+        :param data: A dictionary object.
+        """
+        for key in keys:
+            data = data[key]
         return data
 
+    def lookup(self, keys, data):
+        """Return nested value from the parsed path taken or `MISSING`.
+
+        Unlike `map_from_keys`, absent keys, out of range indexes and
+        values which can not be indexed, such as `None`, do not raise.
+
+        :param keys: A list of keys and indexes.  E.g. ['name', 'first', 0].
+        :param data: A dictionary object.
+        """
+        for key in keys:
+            if isinstance(data, dict):
+                data = data.get(key, MISSING)
+            elif isinstance(data, list) and isinstance(key, int):
+                if not -len(data) <= key < len(data):
+                    return MISSING
+                data = data[key]
+            else:
+                try:
+                    data = data[key]
+                except (KeyError, IndexError, TypeError):
+                    return MISSING
+
+            if data is MISSING:
+                return MISSING
+        return data
+
+    def map_to_keys(self, keys, value, data):
+        """Place a value into data at the parsed path, creating containers.
+
+        Missing, `None` or scalar intermediates are replaced by dictionaries
+        and lists.  Lists are padded with `None` up to the referenced index,
+        at the front for negative indexes.  A `None` value never replaces a
+        container placed by another path.
+
+        :param keys: A list of keys and indexes.  E.g. ['name', 'first', 0].
+        :param value: The value to place.
+        :param data: A dictionary or list object.
+        """
+        for position, key in enumerate(keys):
+            if isinstance(key, int):
+                size = key + 1 if key >= 0 else -key
+                if len(data) < size:
+                    padding = [None] * (size - len(data))
+                    if key < 0:
+                        data[:0] = padding
+                    else:
+                        data.extend(padding)
+                current = data[key]
+            else:
+                current = data.get(key)
+
+            if position < len(keys) - 1:
+                if not isinstance(current, (dict, list)):
+                    if isinstance(keys[position + 1], int):
+                        data[key] = []
+                    else:
+                        data[key] = {}
+                data = data[key]
+            elif value is not None or not isinstance(current, (dict, list)):
+                data[key] = value
+        return None
 
 class AdaptedBoolean(AdaptedField):
     """Parse an adapted field into the boolean type."""
@@ -83,6 +185,9 @@ class AdaptedBoolean(AdaptedField):
     def _deserialize(self, value):
         return bool(value)
 
+    def _serialize(self, value):
+        return bool(value)
+
 
 class AdaptedDate(AdaptedField):
     """Parse an adapted field into the datetime type."""
@@ -94,6 +199,9 @@ class AdaptedDate(AdaptedField):
     def _deserialize(self, value):
         return datetime.strptime(value, self.date_format)
 
+    def _serialize(self, value):
+        return value.strftime(self.date_format)
+
 
 class AdaptedDecimal(AdaptedField):
     """Parse an adapted field into the decimal type."""
@@ -101,6 +209,9 @@ class AdaptedDecimal(AdaptedField):
     def _deserialize(self, value):
         return Decimal(value)
 
+    def _serialize(self, value):
+        return str(value)
+
 
 class AdaptedInteger(AdaptedField):
     """Parse an adapted field into the integer type."""
@@ -108,6 +219,9 @@ class AdaptedInteger(AdaptedField):
     def _deserialize(self, value):
         return int(value)
 
+    def _serialize(self, value):
+        return int(value)
+
 
 class AdaptedFunction(AdaptedField):
     """Parse an adapted field into a specified function's output."""
@@ -152,9 +266,33 @@ class AdaptedNested(AdaptedField):
             return [self.model().load(val) for val in value]
         return self.model().load(value)
 
+    def _deserialize_value(self, value, collect_errors):
+        if not collect_errors:
+            return self._deserialize(value)
+        if not isinstance(value, list):
+            return self.model().load(value, collect_errors)
+
+        models, errors = [], {}
+        for index, val in enumerate(value):
+            try:
+                models.append(self.model().load(val, collect_errors))
+            except LoadError as exc:
+                errors[index] = exc
+        if errors:
+            raise LoadError(errors)
+        return models
+
+    def _serialize(self, value):
+        if isinstance(value, list):
+            return [val.dump() for val in value]
+        return value.dump()
+
 
 class AdaptedString(AdaptedField):
     """Parse an adapted field into the string type."""
 
     def _deserialize(self, value):
         return str(value)
+
+    def _serialize(self, value):
+        return str(value)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+from rest_orm.errors import MemoryBudgetExceeded
+
+from contextlib import contextmanager
+import sys
+import threading
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+_local = threading.local()
+
+
+def current_batch():
+    """Return the `MemoryBatch` active on this thread or `None`."""
+    return getattr(_local, 'batch', None)
+
+
+def estimate_size(obj, seen=None):
+    """Return the approximate number of bytes referenced by an object.
+
+    Containers and instance attributes are followed recursively.  Objects
+    are only counted once.
+
+    :param obj: Any python object.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += estimate_size(key, seen) + estimate_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for value in obj:
+            size += estimate_size(value, seen)
+    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += estimate_size(obj.__dict__, seen)
+    return size
+
+
+class MemoryTracker(object):
+    """Account for the memory used to request, decode and load responses.
+
+    Usage is reported per model and per stage in `usage`.  Stages are
+    `request` (`make_request`), `decode` (`json.loads`) and `load`
+    (`_do_load`).  Stages are accounted within a `MemoryBatch`.  If a
+    `budget` is set, a `MemoryBudgetExceeded` error is raised as soon as a
+    batch accounts for more bytes than allowed.
+    """
+
+    methods = ('estimate', 'tracemalloc')
+
+    def __init__(self, budget=None, method='estimate'):
+        """Accounting settings.
+
+        :param budget: The maximum number of bytes per batch.
+        :param method: `estimate` to size the objects produced by each
+            stage or `tracemalloc` to measure the memory allocated by it.
+            `tracemalloc` measures the whole process, so concurrent threads
+            are counted in each other's batches.
+        """
+        if method not in self.methods:
+            raise ValueError('Unknown method {}.'.format(method))
+        if method == 'tracemalloc' and tracemalloc is None:
+            raise ValueError('tracemalloc is not available.')
+
+        self.budget = budget
+        self.method = method
+        self.usage = {}
+        self.last_batch = 0
+        self.max_batch = 0
+        self.lock = threading.Lock()
+
+        if method == 'tracemalloc' and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def batch(self):
+        """Return a new, empty `MemoryBatch`."""
+        return MemoryBatch(self)
+
+    def _record(self, name, stage, size):
+        with self.lock:
+            stages = self.usage.setdefault(name, {})
+            stages[stage] = stages.get(stage, 0) + size
+
+    def _close(self, batch):
+        with self.lock:
+            self.last_batch = batch.bytes
+            self.max_batch = max(self.max_batch, batch.bytes)
+
+
+class MemoryBatch(object):
+    """A group of stages budgeted together.
+
+    Each top level `connect`, `loads` or `load` call uses its own batch.
+    While a batch is active on a thread, calls made within it, such as
+    `connect` calling `loads` or nested models calling `load`, account to
+    it.  Use as a context manager to activate the batch and close it once
+    its stages are complete.
+    """
+
+    def __init__(self, tracker):
+        """Batch settings.
+
+        :param tracker: The `MemoryTracker` to report to.
+        """
+        self.tracker = tracker
+        self.bytes = 0
+        self.closed = False
+        self.tracking = False
+        self.response = None
+
+    def __enter__(self):
+        self.previous = current_batch()
+        _local.batch = self
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.batch = self.previous
+        self.close()
+
+    @contextmanager
+    def activate(self):
+        """Make the batch active on this thread without closing it."""
+        previous = current_batch()
+        _local.batch = self
+        try:
+            yield self
+        finally:
+            _local.batch = previous
+
+    def close(self):
+        """Report the batch's total to the tracker."""
+        if not self.closed:
+            self.closed = True
+            self.tracker._close(self)
+
+    def track(self, name, stage, f, *args, **kwargs):
+        """Call `f`, account for its memory and return its result.
+
+        :param name: The model's name.
+        :param stage: The stage being measured.
+        :param f: A callable object.
+        """
+        if self.tracking:
+            # The enclosing stage already measures nested loads.
+            return f(*args, **kwargs)
+
+        self.tracking = True
+        try:
+            return self._track(name, stage, f, *args, **kwargs)
+        finally:
+            self.tracking = False
+
+    def _track(self, name, stage, f, *args, **kwargs):
+        if self.tracker.method == 'tracemalloc':
+            before = tracemalloc.get_traced_memory()[0]
+            result = f(*args, **kwargs)
+            size = max(tracemalloc.get_traced_memory()[0] - before, 0)
+        else:
+            result = f(*args, **kwargs)
+            size = estimate_size(result)
+
+        self.account(name, stage, size)
+        return result
+
+    def account(self, name, stage, size):
+        """Record `size` bytes against a model and stage.
+
+        :param name: The model's name.
+        :param stage: The stage being measured.
+        :param size: The number of bytes used.
+        """
+        self.tracker._record(name, stage, size)
+        self.bytes += size
+        self.check(name, stage, 0)
+
+    def check(self, name, stage, size):
+        """Raise if `size` more bytes would exceed the budget.
+
+        :param name: The model's name.
+        :param stage: The stage about to run.
+        :param size: The number of bytes about to be used.
+        """
+        budget = self.tracker.budget
+        if budget is None or self.bytes + size <= budget:
+            return None
+        raise MemoryBudgetExceeded(
+            '{} exceeded the memory budget of {} bytes during {} '
+            '({} bytes).'.format(name, budget, stage, self.bytes + size))
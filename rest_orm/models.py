@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
-from rest_orm.fields import AdaptedField
-from rest_orm.utils import ModelRegistry
+from rest_orm.errors import LoadError
+from rest_orm.fields import MISSING, AdaptedField
+from rest_orm.memory import current_batch
+from rest_orm.utils import ModelRegistry, encode_json, merge_dicts
 
+from contextlib import contextmanager
 import json
 
 
@@ -12,33 +15,190 @@ class BaseModel(object):
 
 
 class AdaptedModel(BaseModel):
-    """A flat representation of a single remote endpoint."""
+    """A flat representation of a single remote endpoint.
+
+    Set `__scheduler__` to a `RequestScheduler` instance to rate limit and
+    bound the concurrency of the model's `make_request` calls.  The dunder
+    name keeps it from colliding with field names.
+
+    Set `__memory__` to a `MemoryTracker` instance to account for the
+    memory used by requests, decoding and loading and to enforce a budget.
+    """
+
+    __scheduler__ = None
+    __memory__ = None
 
     def connect(self, *args, **kwargs):
         """Make a request to a remote endpoint and load its JSON response."""
-        response = self.make_request(*args, **kwargs)
-        return self.loads(response)
+        with self._batch() as batch:
+            if self.__scheduler__ is None:
+                response = self._track(
+                    batch, 'request', self.make_request, *args, **kwargs)
+            else:
+                response = self._track(
+                    batch, 'request', self.__scheduler__.call,
+                    self.make_request, *args, **kwargs)
+            if batch is not None:
+                batch.response = response
+            return self.loads(response)
 
-    def loads(self, response):
+    def loads(self, response, collect_errors=False):
         """Marshal a JSON response object into the model."""
-        return self.load(json.loads(response))
+        with self._batch() as batch:
+            # Responses from `connect` were accounted by the request stage.
+            if batch is not None and batch.response is not response:
+                batch.check(type(self).__name__, 'decode', len(response))
+            data = self._track(batch, 'decode', json.loads, response)
+            return self.load(data, collect_errors)
 
-    def load(self, response):
-        """Marshal a python dictionary object into the model."""
-        self._do_load(response)
+    def load(self, response, collect_errors=False):
+        """Marshal a python dictionary object into the model.
+
+        :param response: A dictionary object.
+        :param collect_errors: If `True`, load every field before raising a
+            single `LoadError` describing each field that failed.
+        """
+        with self._batch() as batch:
+            self._track(batch, 'load', self._do_load, response, collect_errors)
         self.post_load()
         return self
 
+    @classmethod
+    def load_many(cls, responses, collect_errors=False, batch_size=1):
+        """Marshal an iterable of python dictionary objects into models.
+
+        Models are yielded as they are loaded.  When a `__memory__` tracker
+        is set, each group of `batch_size` models is budgeted as one batch,
+        so by default every model is budgeted on its own.  All models are
+        budgeted together if `batch_size` is `None`.
+
+        :param responses: An iterable of dictionary objects.
+        :param collect_errors: See `load`.
+        :param batch_size: The number of models per budgeted batch.
+        """
+        batch = None
+        try:
+            for count, response in enumerate(responses):
+                if batch is not None and batch_size is not None and \
+                        count % batch_size == 0:
+                    batch.close()
+                    batch = None
+                if batch is None and cls.__memory__ is not None:
+                    batch = cls.__memory__.batch()
+
+                if batch is None:
+                    model = cls().load(response, collect_errors)
+                else:
+                    with batch.activate():
+                        model = cls().load(response, collect_errors)
+                yield model
+        finally:
+            if batch is not None:
+                batch.close()
+
     def post_load(self):
         """Perform any model level actions after load."""
         pass
 
-    def _do_load(self, data):
-        for field_name in dir(self):
-            field = getattr(self, field_name)
-            if not isinstance(field, AdaptedField):
+    def dumps(self):
+        """Serialize the model into a JSON string."""
+        return json.dumps(self.dump(), default=encode_json)
+
+    def dump(self):
+        """Serialize the model into a python dictionary object.
+
+        Each field's value is placed at the location its path describes.
+        Fields without a path are merged into the top level when they
+        serialize to a dictionary.  Fields which were never loaded or whose
+        path was absent from the loaded data are skipped.  Explicit `None`
+        values are written unless another field places a dictionary or list
+        at the same location.
+        """
+        data = {}
+        missing = getattr(self, '_missing_fields', ())
+        for field_name, field in self._get_fields():
+            value = getattr(self, field_name)
+            if isinstance(value, AdaptedField) or field_name in missing:
                 continue
-            setattr(self, field_name, field.deserialize(data))
+
+            if field.keys is None:
+                value = field.serialize(value)
+                if isinstance(value, dict):
+                    merge_dicts(data, value)
+            else:
+                field.map_to_keys(field.keys, field.serialize(value), data)
+        return data
+
+    @classmethod
+    def dump_many(cls, models):
+        """Serialize an iterable of models into chunks of a JSON array.
+
+        Each model is encoded as it is reached so large batches can be
+        written out without building the entire array in memory.
+
+        :param models: An iterable of `AdaptedModel` instances.
+        """
+        yield '['
+        for position, model in enumerate(models):
+            if position:
+                yield ','
+            yield model.dumps()
+        yield ']'
+
+    @classmethod
+    def _get_fields(cls):
+        """Return the cached list of `(name, field)` pairs for the class."""
+        if '_fields' not in cls.__dict__:
+            fields = []
+            for field_name in dir(cls):
+                field = getattr(cls, field_name)
+                if isinstance(field, AdaptedField):
+                    fields.append((field_name, field))
+            cls._fields = fields
+        return cls._fields
+
+    @contextmanager
+    def _batch(self):
+        batch = current_batch()
+        if batch is not None or self.__memory__ is None:
+            yield batch
+        else:
+            with self.__memory__.batch() as batch:
+                yield batch
+
+    def _track(self, batch, stage, f, *args, **kwargs):
+        if batch is None:
+            return f(*args, **kwargs)
+        return batch.track(type(self).__name__, stage, f, *args, **kwargs)
+
+    def _do_load(self, data, collect_errors=False):
+        self._missing_fields = set()
+        if not collect_errors:
+            for field_name, field in self._get_fields():
+                self._load_field(field_name, field, data)
+            return self
+
+        errors = {}
+        for field_name, field in self._get_fields():
+            try:
+                self._load_field(field_name, field, data, collect_errors)
+            except Exception as exc:
+                errors[field_name] = exc
+        if errors:
+            raise LoadError(errors)
+        return self
+
+    def _load_field(self, field_name, field, data, collect_errors=False):
+        if collect_errors:
+            value = field.deserialize(data, collect_errors)
+        else:
+            value = field.deserialize(data)
+
+        # Remember absent paths so that dump does not invent them.
+        if value is field.missing and field.keys is not None and \
+                field.lookup(field.keys, data) is MISSING:
+            self._missing_fields.add(field_name)
+        setattr(self, field_name, value)
 
     def make_request(self):
         """Return the response data of a remote endpoint."""
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+from rest_orm.errors import AdapterError, ThrottledError
+
+import threading
+import time
+
+
+class TokenBucket(object):
+    """Token bucket rate limiter.
+
+    Tokens are refilled continuously at `rate` per second up to `capacity`.
+    Each acquisition reserves a token immediately, so concurrent callers
+    are served in the order they arrive.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.time,
+                 sleep=time.sleep):
+        """Rate limit settings.
+
+        :param rate: The number of tokens refilled per second.
+        :param capacity: The maximum burst size.  Defaults to `rate`.
+        :param clock: A callable returning the current time in seconds.
+        :param sleep: A callable which blocks for the given seconds.
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(rate, 1))
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.capacity
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, blocking until one is available.
+
+        Return the number of seconds spent waiting.
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait:
+            self.sleep(wait)
+        return wait
+
+
+class RequestScheduler(object):
+    """Rate limited, adaptive concurrency wrapper for outbound requests.
+
+    Concurrency follows an additive increase, multiplicative decrease
+    policy.  Every successful request raises the in-flight limit by
+    `increase / limit`, so the limit grows by about `increase` for each
+    window of requests, up to `max_in_flight`.  An `AdapterError`
+    multiplies the limit by `decrease` down to `min_in_flight`, at most
+    once per window: failures of requests started before the last decrease
+    are ignored.  Share one instance between models to limit a host rather
+    than a single model.
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None,
+                 min_in_flight=1, adaptive=True, increase=1, decrease=0.5,
+                 clock=time.time, sleep=time.sleep):
+        """Scheduler settings.
+
+        :param rate: Requests allowed per second.  `None` disables the limit.
+        :param burst: The number of requests allowed in a single burst.
+        :param max_in_flight: The maximum number of concurrent requests.
+            `None` disables the limit.
+        :param min_in_flight: The lower bound of the adaptive limit.
+        :param adaptive: If `False`, the in-flight limit never changes.
+        :param increase: The amount added to the limit per window.
+        :param decrease: The factor applied to the limit on failure.
+        :param clock: A callable returning the current time in seconds.
+        :param sleep: A callable which blocks for the given seconds.
+        """
+        self.bucket = None
+        if rate is not None:
+            self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.max_in_flight = max_in_flight
+        self.min_in_flight = min_in_flight
+        self.adaptive = adaptive and max_in_flight is not None
+        self.increase = increase
+        self.decrease = decrease
+        self.clock = clock
+
+        self.limit = max_in_flight
+        self.window = 0
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.requests = 0
+        self.failures = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.condition = threading.Condition()
+
+    def call(self, f, *args, **kwargs):
+        """Call `f` once a rate limit token and an in-flight slot are free."""
+        start = self.clock()
+        with self.condition:
+            self.queue_depth += 1
+        try:
+            # Wait for a token before taking a slot so that rate limited
+            # callers are queued rather than in flight.
+            if self.bucket is not None:
+                self.bucket.acquire()
+            window = self._enter()
+        except BaseException:
+            with self.condition:
+                self.queue_depth -= 1
+            raise
+        self._record_wait(self.clock() - start)
+
+        succeeded = False
+        error = None
+        try:
+            response = f(*args, **kwargs)
+            succeeded = True
+            return response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._exit(window, succeeded, error)
+
+    def metrics(self):
+        """Return a dictionary of the scheduler's current state.
+
+        `limit` is the whole number of requests currently allowed in flight.
+        """
+        with self.condition:
+            return {
+                'queue_depth': self.queue_depth,
+                'in_flight': self.in_flight,
+                'limit': None if self.limit is None else int(self.limit),
+                'requests': self.requests,
+                'failures': self.failures,
+                'throttled': self.throttled,
+                'total_wait': self.total_wait,
+                'max_wait': self.max_wait,
+                'mean_wait': self.total_wait / self.requests
+                if self.requests else 0.0
+            }
+
+    def _enter(self):
+        with self.condition:
+            while not self._has_slot():
+                self.condition.wait()
+            self.queue_depth -= 1
+            self.in_flight += 1
+            return self.window
+
+    def _exit(self, window, succeeded, error):
+        with self.condition:
+            self.in_flight -= 1
+            self.requests += 1
+            if not succeeded:
+                self.failures += 1
+            if isinstance(error, ThrottledError):
+                self.throttled += 1
+
+            if self.adaptive:
+                self._adapt(window, succeeded, error)
+            self.condition.notify_all()
+
+    def _adapt(self, window, succeeded, error):
+        if succeeded:
+            self.limit = min(
+                self.max_in_flight,
+                self.limit + float(self.increase) / self.limit)
+        elif isinstance(error, AdapterError) and window == self.window:
+            # Requests started before the last decrease were sent under the
+            # old limit, so their failures do not decrease it again.
+            self.limit = max(self.min_in_flight, self.limit * self.decrease)
+            self.window += 1
+
+    def _has_slot(self):
+        return self.limit is None or self.in_flight < int(self.limit)
+
+    def _record_wait(self, wait):
+        with self.condition:
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from datetime import date, datetime
+from decimal import Decimal
 
 
 class ModelRegistry(type):
@@ -12,3 +14,22 @@ class ModelRegistry(type):
 
 def get_class(name):
     return ModelRegistry.registry[name]
+
+
+def merge_dicts(target, source):
+    """Recursively merge the source dictionary into the target."""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_dicts(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def encode_json(value):
+    """Return a JSON compatible representation of `Decimal` and `datetime`."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError('{!r} is not JSON serializable.'.format(value))
@@ -140,3 +140,74 @@ class FieldsTestCase(TestCase):
 
         value = field.deserialize({'x': True})
         self.assertTrue(value == 'True')
+
+    def test_serialize_none(self):
+        """Test serializing a `None` type value."""
+        field = fields.AdaptedInteger('[x]')
+        self.assertTrue(field.serialize(None) is None)
+
+    def test_adapted_date_serialization(self):
+        """Test serializing date field."""
+        from datetime import datetime
+
+        field = fields.AdaptedDate('[x]', date_format='%m/%d/%Y')
+        value = field.serialize(datetime(2015, 1, 1))
+        self.assertTrue(value == '01/01/2015')
+
+    def test_adapted_decimal_serialization(self):
+        """Test serializing decimal field."""
+        from decimal import Decimal
+
+        field = fields.AdaptedDecimal('[x]')
+        value = field.serialize(Decimal('12.50'))
+        self.assertTrue(value == '12.50')
+
+    def test_adapted_nested_serialization(self):
+        """Test serializing nested field."""
+        class Test(models.AdaptedModel):
+            number = fields.AdaptedInteger('[y]')
+
+        field = fields.AdaptedNested(Test, path='[x]')
+        value = field.serialize(field.deserialize({'x': [{'y': 1}]}))
+        self.assertTrue(value == [{'y': 1}])
+
+    def test_map_to_keys(self):
+        """Test placing a value into nested dictionaries and lists."""
+        field = fields.AdaptedField('[x][1][y]')
+        data = {}
+        field.map_to_keys(field.keys, 'value', data)
+        self.assertTrue(data == {'x': [None, {'y': 'value'}]})
+
+    def test_lookup_missing(self):
+        """Test looking up absent keys and indexes without raising."""
+        field = fields.AdaptedField('[x][2]')
+        self.assertTrue(field.lookup(field.keys, {'y': 1}) is fields.MISSING)
+        self.assertTrue(
+            field.lookup(field.keys, {'x': [1]}) is fields.MISSING)
+        self.assertTrue(field.lookup(field.keys, {'x': [1, 2, 3]}) == 3)
+
+    def test_deserialize_negative_index(self):
+        """Test deserializing a list item from the end of the list."""
+        field = fields.AdaptedField('[-1]', missing='value')
+        self.assertTrue(field.deserialize([1, 2, 3]) == 3)
+        self.assertTrue(field.deserialize([]) == 'value')
+
+    def test_lookup_null_parent(self):
+        """Test looking up a path beneath a `None` value."""
+        field = fields.AdaptedField('[a][b]', missing='value')
+        value = field.lookup(field.keys, {'a': None})
+        self.assertTrue(value is fields.MISSING)
+        self.assertTrue(field.deserialize({'a': None}) == 'value')
+        self.assertTrue(field.deserialize({'a': [1]}) == 'value')
+
+    def test_adapted_nested_custom_deserialize(self):
+        """Test overriding `_deserialize` on a nested field."""
+        class Test(models.AdaptedModel):
+            number = fields.AdaptedInteger('[y]')
+
+        class CustomNested(fields.AdaptedNested):
+            def _deserialize(self, value):
+                return 'custom'
+
+        field = CustomNested(Test, path='[x]')
+        self.assertTrue(field.deserialize({'x': {'y': 1}}) == 'custom')
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from rest_orm import errors, fields, memory, models
+
+
+class TestModel(models.AdaptedModel):
+    first = fields.AdaptedString('[first]')
+
+    def make_request(self):
+        return '{"first": "First Name"}'
+
+
+class MemoryTestCase(TestCase):
+
+    def test_estimate_size(self):
+        """Test estimating the size of nested containers."""
+        small = memory.estimate_size({'x': [1]})
+        large = memory.estimate_size({'x': [1, 'a' * 1000]})
+        self.assertTrue(large - small > 1000)
+
+    def test_estimate_size_shared_reference(self):
+        """Test counting shared references once."""
+        value = 'a' * 1000
+        self.assertTrue(memory.estimate_size([value, value]) < 2000)
+
+    def test_track_usage(self):
+        """Test reporting usage per model and stage."""
+        tracker = memory.MemoryTracker()
+
+        class Test(TestModel):
+            __memory__ = tracker
+
+        Test().connect()
+        usage = tracker.usage['Test']
+        self.assertTrue(sorted(usage) == ['decode', 'load', 'request'])
+        self.assertTrue(all(size > 0 for size in usage.values()))
+        self.assertTrue(tracker.last_batch == sum(usage.values()))
+
+    def test_budget_fail_fast(self):
+        """Test failing before decoding a response larger than the budget."""
+        tracker = memory.MemoryTracker(budget=10)
+
+        class Test(TestModel):
+            __memory__ = tracker
+
+        try:
+            Test().loads('{"first": "First Name"}')
+            self.assertTrue(False)
+        except errors.MemoryBudgetExceeded:
+            self.assertTrue('decode' not in tracker.usage.get('Test', {}))
+
+    def test_connect_counts_response_once(self):
+        """Test budgeting a connected response once."""
+        class Test(TestModel):
+            def make_request(self):
+                return '{"first": "x"}' + ' ' * 10000
+
+        Test.__memory__ = memory.MemoryTracker()
+        Test().connect()
+        total = Test.__memory__.last_batch
+
+        Test.__memory__ = memory.MemoryTracker(budget=total)
+        self.assertTrue(Test().connect().first == 'x')
+
+    def test_load_many_streaming(self):
+        """Test budgeting each model of a streaming load on its own."""
+        data = [{'first': 'a' * 100} for _ in range(10)]
+        one = memory.estimate_size(TestModel().load(data[0]))
+        tracker = memory.MemoryTracker(budget=one * 3)
+
+        class Test(TestModel):
+            __memory__ = tracker
+
+        self.assertTrue(len(list(Test.load_many(data))) == 10)
+        self.assertTrue(tracker.max_batch <= one * 3)
+
+        self.assertTrue(len(list(Test.load_many(data, batch_size=2))) == 10)
+
+        stream = Test.load_many(data, batch_size=None)
+        self.assertRaises(errors.MemoryBudgetExceeded, list, stream)
+
+    def test_batches_are_isolated(self):
+        """Test loading a model while a streaming load is suspended."""
+        tracker = memory.MemoryTracker()
+
+        class Test(TestModel):
+            __memory__ = tracker
+
+        stream = Test.load_many(
+            [{'first': 'a' * 1000} for _ in range(3)], batch_size=None)
+        next(stream)
+
+        model = Test().load({'first': 'b'})
+        self.assertTrue(tracker.last_batch == memory.estimate_size(model))
+
+        list(stream)
+        self.assertTrue(tracker.last_batch > 3000)
+
+    def test_unknown_method(self):
+        """Test rejecting an unknown accounting method."""
+        self.assertRaises(ValueError, memory.MemoryTracker, method='x')
+
+    def test_model_field_named_memory(self):
+        """Test loading a model with a field named `memory`."""
+        class Device(models.AdaptedModel):
+            memory = fields.AdaptedInteger('[memory]')
+
+        self.assertTrue(Device().load({'memory': 4}).memory == 4)
+
+    def test_overridden_load_is_called(self):
+        """Test dispatching connect and loads through an overridden load."""
+        tracker = memory.MemoryTracker()
+
+        class Envelope(TestModel):
+            __memory__ = tracker
+
+            def make_request(self):
+                return '{"data": {"first": "x"}}'
+
+            def load(self, response, collect_errors=False):
+                return super(Envelope, self).load(
+                    response['data'], collect_errors)
+
+        model = Envelope().loads('{"data": {"first": "x"}}')
+        self.assertTrue(model.first == 'x')
+        self.assertTrue(Envelope().connect().first == 'x')
+        self.assertTrue(
+            sorted(tracker.usage['Envelope']) == ['decode', 'load', 'request'])
+
+    def test_nested_loads_account_to_parent(self):
+        """Test accounting nested models within the parent's batch."""
+        tracker = memory.MemoryTracker()
+
+        class Inner(models.AdaptedModel):
+            __memory__ = tracker
+            first = fields.AdaptedString('[first]')
+
+        class Outer(models.AdaptedModel):
+            __memory__ = tracker
+            inner = fields.AdaptedNested(Inner, path='[inner]')
+
+        model = Outer().load({'inner': {'first': 'a' * 1000}})
+        self.assertTrue('Inner' not in tracker.usage)
+        self.assertTrue(
+            tracker.usage['Outer']['load'] == memory.estimate_size(model))
+        self.assertTrue(tracker.last_batch == memory.estimate_size(model))
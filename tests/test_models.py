@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
+import json
 from unittest import TestCase
 
-from rest_orm import fields, models
+from rest_orm import errors, fields, models
 
 
 class TestModel(models.AdaptedModel):
@@ -35,3 +36,151 @@ class ModelTestCase(TestCase):
         """Test post-load actions created from the post_load method."""
         model = TestModel().load({"first": "First Name"})
         self.assertTrue(model.full_name == 'First Name Last Name')
+
+    def test_model_dump(self):
+        """Test dumping the model into its original structure."""
+        class Test(models.AdaptedModel):
+            first = fields.AdaptedString('[name][first]')
+            last = fields.AdaptedString('[name][last]')
+            tag = fields.AdaptedString('[tags][0]')
+            price = fields.AdaptedDecimal('[price]')
+
+        data = {
+            'name': {'first': 'First', 'last': 'Last'},
+            'tags': ['a'],
+            'price': '12.50'
+        }
+        model = Test().load(data)
+        self.assertTrue(model.dump() == data)
+
+    def test_model_dump_skips_unloaded_fields(self):
+        """Test dumping a model which has not been loaded."""
+        self.assertTrue(TestModel().dump() == {})
+
+    def test_model_dumps(self):
+        """Test dumping the model into a JSON string."""
+        from datetime import datetime
+        from decimal import Decimal
+
+        class Test(models.AdaptedModel):
+            created = fields.AdaptedField('[created]')
+            price = fields.AdaptedField('[price]')
+
+        model = Test().load(
+            {'created': datetime(2015, 1, 1), 'price': Decimal('1.5')})
+        data = json.loads(model.dumps())
+        self.assertTrue(data['created'] == '2015-01-01T00:00:00')
+        self.assertTrue(data['price'] == '1.5')
+
+    def test_model_dump_many(self):
+        """Test dumping many models into a JSON array."""
+        models_ = [TestModel().load({'first': str(i)}) for i in range(3)]
+        data = json.loads(''.join(TestModel.dump_many(models_)))
+        self.assertTrue(data == [{'first': '0'}, {'first': '1'},
+                                 {'first': '2'}])
+        self.assertTrue(''.join(TestModel.dump_many([])) == '[]')
+
+    def test_model_load_collect_errors(self):
+        """Test collecting every field error into a single error."""
+        class Test(models.AdaptedModel):
+            first = fields.AdaptedString('[first]', required=True)
+            number = fields.AdaptedInteger('[number]')
+            last = fields.AdaptedString('[last]')
+
+        try:
+            Test().load({'number': 'x', 'last': 'Last'}, collect_errors=True)
+            self.assertTrue(False)
+        except errors.LoadError as exc:
+            self.assertTrue(sorted(exc.errors) == ['first', 'number'])
+            self.assertTrue(isinstance(exc.errors['first'], KeyError))
+            self.assertTrue(isinstance(exc.errors['number'], ValueError))
+            self.assertTrue(isinstance(exc, errors.AdapterError))
+
+    def test_model_loads_collect_errors(self):
+        """Test loading a valid JSON string while collecting errors."""
+        model = TestModel().loads('{"first": "First"}', collect_errors=True)
+        self.assertTrue(model.first == 'First')
+
+    def test_model_dump_skips_missing_fields(self):
+        """Test dumping a model loaded from a sparse payload."""
+        class Test(models.AdaptedModel):
+            x = fields.AdaptedField('[x]')
+            y = fields.AdaptedField('[x][y]')
+            q = fields.AdaptedField('[z][0][q]')
+
+        self.assertTrue(Test().load({}).dump() == {})
+        self.assertTrue(Test().load({'x': {'y': 1}}).dump() == {'x': {'y': 1}})
+
+    def test_model_dump_none_container(self):
+        """Test dumping a nested path beside a `None` value."""
+        class Test(models.AdaptedModel):
+            a = fields.AdaptedField('[x][y]')
+            b = fields.AdaptedField('[x]', missing='default')
+
+        model = Test().load({'x': {'y': 1}})
+        model.b = None
+        self.assertTrue(model.dump() == {'x': {'y': 1}})
+
+        class Test(models.AdaptedModel):
+            a = fields.AdaptedField('[x]', missing='default')
+            b = fields.AdaptedField('[x][y]')
+
+        model = Test().load({'x': {'y': 1}})
+        model.a = None
+        self.assertTrue(model.dump() == {'x': {'y': 1}})
+
+    def test_model_dump_explicit_null(self):
+        """Test dumping explicit `None` values regardless of `missing`."""
+        class Test(models.AdaptedModel):
+            x = fields.AdaptedField('[x]')
+            y = fields.AdaptedField('[y]', missing=0)
+
+        data = {'x': None, 'y': None}
+        self.assertTrue(Test().load(data).dump() == data)
+        self.assertTrue(Test().load({}).dump() == {})
+
+    def test_model_dump_negative_index(self):
+        """Test dumping a path which indexes from the end of a list."""
+        class Test(models.AdaptedModel):
+            last = fields.AdaptedField('[items][-1]')
+
+        model = Test().load({'items': [1, 2, 3]})
+        self.assertTrue(model.dump() == {'items': [3]})
+        self.assertTrue(Test().load(model.dump()).last == 3)
+
+    def test_model_dump_nested_without_path(self):
+        """Test merging a path-less nested model into the dump."""
+        class Inner(models.AdaptedModel):
+            first = fields.AdaptedString('[name][first]')
+
+        class Outer(models.AdaptedModel):
+            last = fields.AdaptedString('[name][last]')
+            inner = fields.AdaptedNested(Inner, path=None)
+
+        data = {'name': {'first': 'First', 'last': 'Last'}}
+        self.assertTrue(Outer().load(data).dump() == data)
+
+    def test_model_load_collect_nested_errors(self):
+        """Test collecting the field errors of nested models."""
+        class Inner(models.AdaptedModel):
+            a = fields.AdaptedString('[a]', required=True)
+            b = fields.AdaptedInteger('[b]')
+
+        class Outer(models.AdaptedModel):
+            inner = fields.AdaptedNested(Inner, path='[inner]')
+            items = fields.AdaptedNested(Inner, path='[items]')
+
+        data = {
+            'inner': {'b': 'x'},
+            'items': [{'a': 'a', 'b': 1}, {'b': 'y'}]
+        }
+        try:
+            Outer().load(data, collect_errors=True)
+            self.assertTrue(False)
+        except errors.LoadError as exc:
+            inner = exc.errors['inner']
+            self.assertTrue(isinstance(inner, errors.LoadError))
+            self.assertTrue(sorted(inner.errors) == ['a', 'b'])
+            items = exc.errors['items']
+            self.assertTrue(sorted(items.errors) == [1])
+            self.assertTrue(sorted(items.errors[1].errors) == ['a', 'b'])
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+from threading import Event, Lock, Thread
+from unittest import TestCase
+import time
+
+from rest_orm import errors, fields, models, scheduler
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class SimulatedEndpoint(object):
+    """Local endpoint which records its peak concurrency."""
+
+    def __init__(self, delay=0.01, throttle=False):
+        self.delay = delay
+        self.throttle = throttle
+        self.active = 0
+        self.peak = 0
+        self.lock = Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if self.throttle:
+            raise errors.ThrottledError('429 Too Many Requests')
+        return '{"first": "First Name"}'
+
+
+class SchedulerTestCase(TestCase):
+
+    def test_token_bucket_burst(self):
+        """Test acquiring tokens within the burst capacity."""
+        clock = FakeClock()
+        bucket = scheduler.TokenBucket(
+            2, capacity=2, clock=clock.time, sleep=clock.sleep)
+        self.assertTrue(bucket.acquire() == 0)
+        self.assertTrue(bucket.acquire() == 0)
+        self.assertTrue(clock.now == 0)
+
+    def test_token_bucket_rate(self):
+        """Test waiting for a token once the bucket is empty."""
+        clock = FakeClock()
+        bucket = scheduler.TokenBucket(
+            2, capacity=1, clock=clock.time, sleep=clock.sleep)
+        bucket.acquire()
+        self.assertTrue(bucket.acquire() == 0.5)
+        self.assertTrue(bucket.acquire() == 0.5)
+        self.assertTrue(clock.now == 1.0)
+
+    def test_max_in_flight(self):
+        """Test bounding the number of concurrent requests."""
+        endpoint = SimulatedEndpoint()
+        schedule = scheduler.RequestScheduler(max_in_flight=2, adaptive=False)
+        threads = [
+            Thread(target=schedule.call, args=(endpoint, ))
+            for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = schedule.metrics()
+        self.assertTrue(endpoint.peak <= 2)
+        self.assertTrue(metrics['requests'] == 6)
+        self.assertTrue(metrics['queue_depth'] == 0)
+        self.assertTrue(metrics['in_flight'] == 0)
+
+    def test_adaptive_backoff(self):
+        """Test decreasing the in-flight limit on throttled requests."""
+        schedule = scheduler.RequestScheduler(max_in_flight=8)
+        endpoint = SimulatedEndpoint(delay=0, throttle=True)
+        for _ in range(2):
+            try:
+                schedule.call(endpoint)
+                self.assertTrue(False)
+            except errors.ThrottledError:
+                pass
+
+        metrics = schedule.metrics()
+        self.assertTrue(metrics['limit'] == 2)
+        self.assertTrue(metrics['throttled'] == 2)
+        self.assertTrue(metrics['failures'] == 2)
+
+        endpoint.throttle = False
+        schedule.call(endpoint)
+        self.assertTrue(schedule.limit == 2.5)
+        self.assertTrue(schedule.metrics()['limit'] == 2)
+
+    def test_adaptive_additive_increase(self):
+        """Test growing the in-flight limit by about one per window."""
+        schedule = scheduler.RequestScheduler(max_in_flight=16)
+        schedule.limit = 4
+        for _ in range(4):
+            schedule.call(lambda: None)
+        self.assertTrue(4.9 < schedule.limit < 5)
+
+    def test_adaptive_single_decrease_per_window(self):
+        """Test decreasing the limit once for concurrent failures."""
+        started = []
+        ready = Event()
+
+        def endpoint():
+            started.append(1)
+            if len(started) == 3:
+                ready.set()
+            ready.wait(1)
+            raise errors.ThrottledError('429 Too Many Requests')
+
+        schedule = scheduler.RequestScheduler(max_in_flight=8)
+        threads = [
+            Thread(target=self.assertRaises,
+                   args=(errors.ThrottledError, schedule.call, endpoint))
+            for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(schedule.metrics()['throttled'] == 3)
+        self.assertTrue(schedule.limit == 4)
+
+    def test_base_exception_releases_slot(self):
+        """Test releasing the in-flight slot on a `BaseException`."""
+        def interrupt():
+            raise KeyboardInterrupt
+
+        schedule = scheduler.RequestScheduler(max_in_flight=1)
+        self.assertRaises(KeyboardInterrupt, schedule.call, interrupt)
+
+        metrics = schedule.metrics()
+        self.assertTrue(metrics['in_flight'] == 0)
+        self.assertTrue(metrics['failures'] == 1)
+        self.assertTrue(schedule.call(lambda: 'value') == 'value')
+
+    def test_adaptive_lower_bound(self):
+        """Test bounding the in-flight limit by min_in_flight."""
+        def fail():
+            raise errors.AdapterError('Unreachable.')
+
+        schedule = scheduler.RequestScheduler(max_in_flight=4)
+        for _ in range(5):
+            self.assertRaises(errors.AdapterError, schedule.call, fail)
+        self.assertTrue(schedule.metrics()['limit'] == 1)
+
+    def test_model_connect_scheduled(self):
+        """Test routing the connect method through a scheduler."""
+        schedule = scheduler.RequestScheduler(rate=100, max_in_flight=1)
+
+        class Test(models.AdaptedModel):
+            first = fields.AdaptedString('[first]')
+            __scheduler__ = schedule
+
+            def make_request(self):
+                return '{"first": "First Name"}'
+
+        model = Test().connect()
+        self.assertTrue(model.first == 'First Name')
+        self.assertTrue(schedule.metrics()['requests'] == 1)
+
+    def test_model_field_named_scheduler(self):
+        """Test connecting a model with a field named `scheduler`."""
+        class Test(models.AdaptedModel):
+            scheduler = fields.AdaptedString('[scheduler]')
+
+            def make_request(self):
+                return '{"scheduler": "cron"}'
+
+        self.assertTrue(Test().connect().scheduler == 'cron')
+
+    def test_rate_limited_callers_are_queued(self):
+        """Test counting callers waiting for a token in the queue."""
+        clock = FakeClock()
+        observed = []
+
+        def sleep(seconds):
+            observed.append(schedule.metrics())
+            clock.sleep(seconds)
+
+        schedule = scheduler.RequestScheduler(
+            rate=1, burst=1, max_in_flight=4, clock=clock.time, sleep=sleep)
+        schedule.call(lambda: None)
+        schedule.call(lambda: None)
+
+        self.assertTrue(len(observed) == 1)
+        self.assertTrue(observed[0]['queue_depth'] == 1)
+        self.assertTrue(observed[0]['in_flight'] == 0)
+        self.assertTrue(schedule.metrics()['queue_depth'] == 0)
+        self.assertTrue(schedule.metrics()['max_wait'] == 1)